@@ -1,15 +1,16 @@
 """HvacActuator library and dependencies."""
 
 import asyncio
-from collections.abc import Callable, Coroutine
-from enum import StrEnum
-from functools import reduce
+import logging
+from collections.abc import Coroutine, Iterable
+from enum import Enum
 from typing import Any
 
 from homeassistant.components.climate import (
     ATTR_HVAC_MODE,
     ATTR_TARGET_TEMP_HIGH,
     ATTR_TARGET_TEMP_LOW,
+    ATTR_TARGET_TEMP_STEP,
     DOMAIN as CLIMATE_DOMAIN,
     SERVICE_SET_HVAC_MODE,
     SERVICE_SET_TEMPERATURE,
@@ -26,7 +27,25 @@ from homeassistant.core import Context, HomeAssistant, State
 from .const import LOGGER
 
 
-class HvacActuatorType(StrEnum):
+async def async_call_grouped_climate_service(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    service: str,
+    data: dict[str, Any] | None,
+    context: Context | None = None,
+) -> None:
+    """Call a climate service targeting several entities at once."""
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        service,
+        data,
+        target={ATTR_ENTITY_ID: entity_ids},
+        context=context,
+        blocking=True,
+    )
+
+
+class HvacActuatorType(Enum):
     """HVAC group actuator type."""
 
     HEATER = "heater"
@@ -36,6 +55,18 @@ class HvacActuatorType(StrEnum):
 class HvacGroupActuator:
     """An actuator (heater/cooler) from a HVAC group."""
 
+    __slots__ = (
+        "hass",
+        "actuator_type",
+        "_context",
+        "_entity_id",
+        "_service_target",
+        "loaded",
+        "_pending_service",
+        "_pending_data",
+        "_supports_range",
+    )
+
     def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
         """Initialize a HVAC group actuator."""
         self.hass: HomeAssistant = hass
@@ -44,10 +75,12 @@ class HvacGroupActuator:
         self._context: Context | None = None
 
         self._entity_id: str = entity_id
+        self._service_target: dict[str, Any] = {ATTR_ENTITY_ID: entity_id}
         self.loaded: bool = False
 
-        self._action_to_commit: Coroutine | None = None
-        self._commit_semaphore = asyncio.Semaphore()
+        self._pending_service: str | None = None
+        self._pending_data: dict[str, Any] | None = None
+        self._supports_range: bool | None = None
 
     @property
     def entity_id(self) -> str:
@@ -60,21 +93,88 @@ class HvacGroupActuator:
         return self.hass.states.get(self.entity_id)
 
     @property
-    def commit_action(self) -> Coroutine | None:
-        """Get the action to commit."""
-        return self._action_to_commit
-
-    async def _set_commit_action(self, action: Coroutine):
-        """Set the action to commit."""
-        async with self._commit_semaphore:
-            if self._action_to_commit:
-                LOGGER.debug("Closing commit action on %s", self._entity_id)
-                self._action_to_commit.close()
-            self._action_to_commit = action
+    def supports_temperature_range(self) -> bool:
+        """Whether the underlying climate entity supports a target temp range.
+
+        The result is cached since supported features virtually never
+        change at runtime; `reset_supported_features` invalidates it.
+        """
+        if (supports_range := self._supports_range) is None:
+            supports_range = self._supports_range = bool(
+                ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+                & self.state.attributes.get(ATTR_SUPPORTED_FEATURES, 0)
+            )
+        return supports_range
+
+    def reset_supported_features(self) -> None:
+        """Invalidate the cached supported features of the underlying entity."""
+        self._supports_range = None
+
+    @property
+    def commit_action(self) -> tuple[str, dict[str, Any]] | None:
+        """Get the pending service call as a (service, data) tuple."""
+        if self._pending_data is None:
+            return None
+        return (self._pending_service, self._pending_data)
+
+    def clear_commit_action(self) -> None:
+        """Drop the pending service call without executing it."""
+        self._pending_service = None
+        self._pending_data = None
+
+    def _queue_service_call(self, service: str, data: dict[str, Any]) -> None:
+        """Merge a service call into the pending commit action.
+
+        `climate.set_temperature` accepts `hvac_mode`, so a queued mode
+        change followed by a temperature write (or vice versa) collapses
+        into a single downstream service call, with the last write
+        winning per key. Runs without the commit lock: the merge has no
+        suspension point, so it cannot interleave with a running commit,
+        which pops the pending call before awaiting it.
+        """
+        if self._pending_data is None:
+            self._pending_service = service
+            self._pending_data = dict(data)
+            return
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("Merging commit action on %s", self._entity_id)
+        if service == SERVICE_SET_TEMPERATURE:
+            self._pending_service = SERVICE_SET_TEMPERATURE
+        self._pending_data.update(data)
+
+    def _matches_state(self, state: State, data: dict[str, Any]) -> bool:
+        """Whether the actuator already matches the values in `data`.
+
+        Temperatures compare within half a target step, absorbing
+        float and string formatting noise in reported attributes.
+        Anything unparseable counts as a mismatch so the call still
+        goes through.
+        """
+        attrs = state.attributes
+        if (hvac_mode := data.get(ATTR_HVAC_MODE)) is not None and (
+            hvac_mode != state.state
+        ):
+            return False
+        try:
+            tolerance = float(attrs.get(ATTR_TARGET_TEMP_STEP, 0.1)) / 2
+            for attr in (ATTR_TEMPERATURE, ATTR_TARGET_TEMP_LOW, ATTR_TARGET_TEMP_HIGH):
+                if (target := data.get(attr)) is None:
+                    continue
+                current = attrs.get(attr)
+                if current is None or abs(float(target) - float(current)) > tolerance:
+                    return False
+        except (TypeError, ValueError):
+            return False
+        return True
 
     def set_context(self, context: Context | None) -> None:
-        """Set the context."""
-        self._context = context
+        """Set the context, skipping the write if it is unchanged.
+
+        The same Context object is fanned out to every member of a
+        group, often repeatedly within one control run.
+        """
+        if context is not self._context:
+            self._context = context
 
     def _guess_target_temperature(
         self,
@@ -87,19 +187,13 @@ class HvacGroupActuator:
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set the HVAC mode on an actuator."""
-        await self._set_commit_action(
-            create_coro(
-                self._async_call_climate_service,
+        self._queue_service_call(SERVICE_SET_HVAC_MODE, {ATTR_HVAC_MODE: hvac_mode})
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Creating commit action `set_hvac_mode` on %s %s",
+                self.__class__,
                 self._entity_id,
-                SERVICE_SET_HVAC_MODE,
-                {ATTR_HVAC_MODE: hvac_mode},
             )
-        )
-        LOGGER.debug(
-            "Creating commit action `set_hvac_mode` on %s %s",
-            self.__class__,
-            self._entity_id,
-        )
 
     async def async_set_temperature(
         self,
@@ -109,29 +203,33 @@ class HvacGroupActuator:
         hvac_mode: HVACMode | None = None,
     ) -> None:
         """Set the reference temperature of an actuator."""
-        LOGGER.debug(
-            "Attempting to set temperature of %s %s to (%s %s %s) and mode to %s",
-            self.__class__,
-            self._entity_id,
-            temperature,
-            target_temp_low,
-            target_temp_high,
-            hvac_mode,
-        )
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Attempting to set temperature of %s %s to (%s %s %s) and mode to %s",
+                self.__class__,
+                self._entity_id,
+                temperature,
+                target_temp_low,
+                target_temp_high,
+                hvac_mode,
+            )
         # Prevent receiving both target temperature and target range
-        assert None in (temperature, target_temp_high, target_temp_low)
+        if temperature is not None and (
+            target_temp_high is not None or target_temp_low is not None
+        ):
+            raise ValueError(
+                "Cannot set both a target temperature and a target temperature range"
+            )
 
-        if self.state is None:
+        state = self.state
+        if state is None:
             LOGGER.warning(
                 "Attempting to set temperature of unloaded climate entity %s. Aborting",
-                self.entity_id,
+                self._entity_id,
             )
             return
 
-        data = {}
-        if ClimateEntityFeature.TARGET_TEMPERATURE_RANGE & self.state.attributes.get(
-            ATTR_SUPPORTED_FEATURES, 0
-        ):
+        if self.supports_temperature_range:
             data = {
                 ATTR_TARGET_TEMP_LOW: target_temp_low or temperature,
                 ATTR_TARGET_TEMP_HIGH: target_temp_high or temperature,
@@ -144,21 +242,23 @@ class HvacGroupActuator:
             }
 
         if hvac_mode is not None:
-            data.update({ATTR_HVAC_MODE: hvac_mode})
+            data[ATTR_HVAC_MODE] = hvac_mode
+
+        if self._matches_state(state, data):
+            # Already at the requested values; drop any previously
+            # queued call too, since this is the latest intent
+            self.clear_commit_action()
+            if LOGGER.isEnabledFor(logging.DEBUG):
+                LOGGER.debug("Skipping no-op set_temperature on %s", self._entity_id)
+            return
 
-        await self._set_commit_action(
-            create_coro(
-                self._async_call_climate_service,
+        self._queue_service_call(SERVICE_SET_TEMPERATURE, data)
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Creating commit action `set_temperature` on %s %s",
+                self.__class__,
                 self._entity_id,
-                SERVICE_SET_TEMPERATURE,
-                data,
             )
-        )
-        LOGGER.debug(
-            "Creating commit action `set_temperature` on %s %s",
-            self.__class__,
-            self._entity_id,
-        )
 
     async def _async_call_climate_service(
         self,
@@ -166,24 +266,25 @@ class HvacGroupActuator:
         service: str,
         data: dict[str, Any] | None,
     ) -> None:
-        """Call a climate service."""
+        """Call a climate service.
+
+        `blocking=True` is deliberate: the commit must not report
+        success before the downstream handler has run, so waiting is
+        pushed down here and concurrency comes from the dict-level
+        `asyncio.gather` fan-out, which drives all member calls at
+        once. `blocking=False` with self-tracked tasks would only help
+        callers that do not care about completion, which none of the
+        current ones are.
+        """
         await self.hass.services.async_call(
             CLIMATE_DOMAIN,
             service,
             data,
-            target={ATTR_ENTITY_ID: self._entity_id},
+            target=self._service_target,
             context=self._context,
             blocking=True,
         )
 
-    async def async_call_climate_service(
-        self, service: str, data: dict[str, Any]
-    ) -> None:
-        """Public wrapper for calling a climate service."""
-        await self._async_call_climate_service(
-            entity_id=self._entity_id, service=service, data=data
-        )
-
     async def async_turn_on(
         self,
         temperature: float | None = None,
@@ -211,25 +312,33 @@ class HvacGroupActuator:
         )
 
     async def async_commit(self) -> None:
-        """Execute the last service call."""
-        async with self._commit_semaphore:
-            if self._action_to_commit is not None:
-                await self._action_to_commit
+        """Execute the merged pending service call.
+
+        The pending call is popped before any await, so the swap is
+        atomic on the event loop and needs no lock: a concurrent queue
+        or commit sees either the old pending call or none at all.
+        """
+        service = self._pending_service
+        data = self._pending_data
+        self._pending_service = None
+        self._pending_data = None
+        if data is not None:
+            await self._async_call_climate_service(self._entity_id, service, data)
+            if LOGGER.isEnabledFor(logging.DEBUG):
                 LOGGER.debug(
                     "Commit action run for %s %s. Removing",
                     self.__class__,
                     self._entity_id,
                 )
-                self._action_to_commit = None
-            else:
-                LOGGER.debug(
-                    "No commit action for %s %s", self.__class__, self._entity_id
-                )
+        elif LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug("No commit action for %s %s", self.__class__, self._entity_id)
 
 
 class HvacGroupHeater(HvacGroupActuator):
     """A heater actuator for a HVAC group."""
 
+    __slots__ = ()
+
     def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
         """Initialize a HVAC group heater."""
         super().__init__(hass, entity_id)
@@ -262,6 +371,8 @@ class HvacGroupHeater(HvacGroupActuator):
 class HvacGroupCooler(HvacGroupActuator):
     """A cooler actuator for a HVAC group."""
 
+    __slots__ = ()
+
     def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
         """Initialize a HVAC group cooler."""
         super().__init__(hass, entity_id)
@@ -294,15 +405,45 @@ class HvacGroupCooler(HvacGroupActuator):
 class HvacGroupActuatorDict(dict[str, HvacGroupActuator]):
     """A special dictionary of actuators."""
 
+    _values_cache: tuple[HvacGroupActuator, ...] | None = None
+
+    def __setitem__(self, key: str, value: HvacGroupActuator) -> None:
+        """Add an actuator, invalidating the cached member tuple."""
+        self._values_cache = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an actuator, invalidating the cached member tuple."""
+        self._values_cache = None
+        super().__delitem__(key)
+
+    def update(self, *args: Any, **kwargs: HvacGroupActuator) -> None:
+        """Add actuators, invalidating the cached member tuple."""
+        self._values_cache = None
+        super().update(*args, **kwargs)
+
+    def _actuators(self) -> tuple[HvacGroupActuator, ...]:
+        """Get the members as a tuple, cached until the dict is mutated.
+
+        Groups are configured once and iterated on every control run,
+        so this avoids allocating a fresh values view per fan-out.
+        """
+        if (actuators := self._values_cache) is None:
+            actuators = self._values_cache = tuple(self.values())
+        return actuators
+
     @property
     def loaded(self) -> bool:
         """State whether a dict of actuators was loaded or not."""
 
-        return reduce(
-            lambda prev, cur: prev and cur,
-            (act.loaded for act in self.values()),
-            True,
-        )
+        return all(act.loaded for act in self._actuators())
+
+    async def _async_fan_out(self, coros: Iterable[Coroutine]) -> None:
+        """Await coroutines for all actuators concurrently, logging failures."""
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for actuator, result in zip(self._actuators(), results):
+            if isinstance(result, Exception):
+                LOGGER.warning("Error on actuator %s: %s", actuator.entity_id, result)
 
     async def async_turn_on(
         self,
@@ -312,13 +453,17 @@ class HvacGroupActuatorDict(dict[str, HvacGroupActuator]):
         context: Context | None = None,
     ) -> None:
         """Turn on all HvacGroupActuator items of a dictionary."""
-        for actuator in self.values():
+        coros: list[Coroutine] = []
+        for actuator in self._actuators():
             actuator.set_context(context)
-            await actuator.async_turn_on(
-                temperature=temperature,
-                target_temp_high=target_temp_high,
-                target_temp_low=target_temp_low,
+            coros.append(
+                actuator.async_turn_on(
+                    temperature=temperature,
+                    target_temp_high=target_temp_high,
+                    target_temp_low=target_temp_low,
+                )
             )
+        await self._async_fan_out(coros)
 
     async def async_turn_off(
         self,
@@ -328,21 +473,27 @@ class HvacGroupActuatorDict(dict[str, HvacGroupActuator]):
         context: Context | None = None,
     ) -> None:
         """Turn off all HvacGroupActuator items of a dictionary."""
-        for actuator in self.values():
+        coros: list[Coroutine] = []
+        for actuator in self._actuators():
             actuator.set_context(context)
-            await actuator.async_turn_off(
-                temperature=temperature,
-                target_temp_high=target_temp_high,
-                target_temp_low=target_temp_low,
+            coros.append(
+                actuator.async_turn_off(
+                    temperature=temperature,
+                    target_temp_high=target_temp_high,
+                    target_temp_low=target_temp_low,
+                )
             )
+        await self._async_fan_out(coros)
 
     async def async_set_hvac_mode(
         self, hvac_mode: HVACMode, context: Context | None = None
     ) -> None:
         """Set HVAC mode for all HvacGroupActuator items of a dictionary."""
-        for actuator in self.values():
+        coros: list[Coroutine] = []
+        for actuator in self._actuators():
             actuator.set_context(context)
-            await actuator.async_set_hvac_mode(hvac_mode)
+            coros.append(actuator.async_set_hvac_mode(hvac_mode))
+        await self._async_fan_out(coros)
 
     async def async_set_temperature(
         self,
@@ -353,22 +504,59 @@ class HvacGroupActuatorDict(dict[str, HvacGroupActuator]):
         context: Context | None = None,
     ) -> None:
         """Set target temperature all HvacGroupActuator items of a dictionary."""
-        for actuator in self.values():
+        coros: list[Coroutine] = []
+        for actuator in self._actuators():
             actuator.set_context(context)
-            await actuator.async_set_temperature(
-                temperature=temperature,
-                target_temp_high=target_temp_high,
-                target_temp_low=target_temp_low,
-                hvac_mode=hvac_mode,
+            coros.append(
+                actuator.async_set_temperature(
+                    temperature=temperature,
+                    target_temp_high=target_temp_high,
+                    target_temp_low=target_temp_low,
+                    hvac_mode=hvac_mode,
+                )
             )
+        await self._async_fan_out(coros)
 
     async def async_commit(self) -> None:
-        """Commit state changes for all members."""
-        for actuator in self.values():
-            await actuator.async_commit()
-
-
-async def create_coro(function: Callable, *args, **kwargs) -> Any:
-    """Create a coro wrapper used to patch methods in tests."""
-    LOGGER.debug("Running coroutine %s(%s)", function, args)
-    return await function(*args, **kwargs)
+        """Commit state changes for all members.
+
+        Members whose pending calls share the same service and data are
+        batched into a single multi-target service call instead of one
+        call per actuator; the remaining members commit individually.
+        """
+        batches: dict[
+            tuple[str, tuple[tuple[str, Any], ...]], list[HvacGroupActuator]
+        ] = {}
+        for actuator in self._actuators():
+            if (pending := actuator.commit_action) is not None:
+                service, data = pending
+                key = (service, tuple(sorted(data.items())))
+                batches.setdefault(key, []).append(actuator)
+
+        coros: list[Coroutine] = []
+        labels: list[str] = []
+        for (service, _), actuators in batches.items():
+            if len(actuators) < 2:
+                continue
+            _, data = actuators[0].commit_action
+            context = actuators[0]._context
+            entity_ids = [actuator.entity_id for actuator in actuators]
+            for actuator in actuators:
+                actuator.clear_commit_action()
+            coros.append(
+                async_call_grouped_climate_service(
+                    actuators[0].hass, entity_ids, service, data, context
+                )
+            )
+            labels.append(", ".join(entity_ids))
+
+        # Actuators consumed by a batch above no longer have a pending
+        # call, so their individual commit is a no-op.
+        for actuator in self._actuators():
+            coros.append(actuator.async_commit())
+            labels.append(actuator.entity_id)
+
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for label, result in zip(labels, results):
+            if isinstance(result, Exception):
+                LOGGER.warning("Error committing %s: %s", label, result)
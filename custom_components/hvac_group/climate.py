@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 import asyncio
+import logging
 from typing import Any
 
 from homeassistant.components.climate import (
@@ -23,6 +24,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
     ATTR_SUPPORTED_FEATURES,
     ATTR_TEMPERATURE,
+    ATTR_UNIT_OF_MEASUREMENT,
     CONF_NAME,
     PRECISION_HALVES,
     PRECISION_WHOLE,
@@ -46,18 +48,21 @@ from .const import (
     CONF_CURRENT_TEMPERATURE_ENTITY_ID,
     CONF_COOLERS,
     CONF_HEATERS,
+    CONF_HYSTERESIS,
     CONF_MAX_TEMP,
     CONF_MIN_TEMP,
     CONF_PRECISION,
     CONF_TARGET_TEMP_STEP,
     CONF_TOGGLE_COOLERS,
     CONF_TOGGLE_HEATERS,
+    DEFAULT_HYSTERESIS,
     LOGGER,
 )
 from .actuator import (
     HvacGroupHeater,
     HvacGroupCooler,
     HvacActuatorType,
+    HvacGroupActuator,
     HvacGroupActuatorDict,
 )
 
@@ -69,15 +74,17 @@ async def async_setup_entry(
 ) -> None:
     """Initialize HVAC group config entry."""
 
-    name = config_entry.options.get(CONF_NAME)
+    options = config_entry.options
+
+    name = options.get(CONF_NAME)
     unique_id = config_entry.entry_id
 
-    sensor_entity_id = config_entry.options.get(CONF_CURRENT_TEMPERATURE_ENTITY_ID)
+    sensor_entity_id = options.get(CONF_CURRENT_TEMPERATURE_ENTITY_ID)
 
     temperature_unit = hass.config.units.temperature_unit
 
-    precision = config_entry.options.get(CONF_PRECISION)
-    target_temperature_step = config_entry.options.get(
+    precision = options.get(CONF_PRECISION)
+    target_temperature_step = options.get(
         CONF_TARGET_TEMP_STEP,
         (
             PRECISION_HALVES
@@ -86,36 +93,33 @@ async def async_setup_entry(
         ),
     )
 
-    min_temp = config_entry.options.get(
-        CONF_MIN_TEMP,
-        TemperatureConverter.convert(
+    # Only run the unit-conversion machinery when the option is unset;
+    # an eager .get() default would convert on every reload
+    min_temp = options.get(CONF_MIN_TEMP)
+    if min_temp is None:
+        min_temp = TemperatureConverter.convert(
             DEFAULT_MIN_TEMP, UnitOfTemperature.CELSIUS, temperature_unit
-        ),
-    )
-    max_temp = config_entry.options.get(
-        CONF_MAX_TEMP,
-        TemperatureConverter.convert(
+        )
+    max_temp = options.get(CONF_MAX_TEMP)
+    if max_temp is None:
+        max_temp = TemperatureConverter.convert(
             DEFAULT_MAX_TEMP, UnitOfTemperature.CELSIUS, temperature_unit
-        ),
-    )
+        )
+
+    toggle_coolers = options.get(CONF_TOGGLE_COOLERS, False)
+    toggle_heaters = options.get(CONF_TOGGLE_HEATERS, False)
 
-    toggle_coolers = config_entry.options.get(CONF_TOGGLE_COOLERS, False)
-    toggle_heaters = config_entry.options.get(CONF_TOGGLE_HEATERS, False)
+    hysteresis = options.get(CONF_HYSTERESIS, DEFAULT_HYSTERESIS)
 
     hvac_actuator_entity_ids: dict[str, set[str]] = {}
     registry = er.async_get(hass)
 
-    for hvac_actuator_type in [CONF_HEATERS, CONF_COOLERS]:
-        target_entities = set()
-        if (
-            hvac_actuator_type in config_entry.options
-            and len(config_entry.options[hvac_actuator_type]) > 0
-        ):
-            for entity_id in config_entry.options[hvac_actuator_type]:
-                validated_entity_id = er.async_validate_entity_id(registry, entity_id)
-                target_entities.add(validated_entity_id)
-        if len(target_entities) > 0:
-            hvac_actuator_entity_ids.update({hvac_actuator_type: target_entities})
+    for hvac_actuator_type in (CONF_HEATERS, CONF_COOLERS):
+        if entity_ids := options.get(hvac_actuator_type):
+            hvac_actuator_entity_ids[hvac_actuator_type] = {
+                er.async_validate_entity_id(registry, entity_id)
+                for entity_id in entity_ids
+            }
 
     entity = HvacGroupClimateEntity(
         hass,
@@ -131,28 +135,52 @@ async def async_setup_entry(
         coolers=hvac_actuator_entity_ids.get(CONF_COOLERS, set()),
         toggle_coolers=toggle_coolers,
         toggle_heaters=toggle_heaters,
+        hysteresis=hysteresis,
     )
 
     async_add_entities([entity])
 
 
+# Modes under which each actuator side may run, to avoid building a
+# throwaway list for every membership test in the control loop
+_HEAT_MODES = frozenset({HVACMode.HEAT, HVACMode.HEAT_COOL})
+_COOL_MODES = frozenset({HVACMode.COOL, HVACMode.HEAT_COOL})
+
+# Actuator attributes which can influence the group state; events that
+# change none of these (and not the state itself) are no-ops for us
+_WATCHED_ACTUATOR_ATTRS = frozenset(
+    (
+        ATTR_MIN_TEMP,
+        ATTR_MAX_TEMP,
+        ATTR_SUPPORTED_FEATURES,
+        ATTR_TARGET_TEMP_LOW,
+        ATTR_TARGET_TEMP_HIGH,
+        ATTR_HVAC_MODE,
+        ATTR_CURRENT_TEMPERATURE,
+    )
+)
+
+
 def state_diff(new: State, old: State) -> dict[str, Any]:
     """Compute the difference between 2 states."""
 
     if old is None:
         return {"state": new.state, "attributes": new.attributes}
 
+    new_attrs = new.attributes
+    old_attrs = old.attributes
+
     diff: dict[str, Any] = {"attributes": {}}
+    attr_diff = diff["attributes"]
     if new.state != old.state:
-        diff.update({"state": (new.state, old.state)})
+        diff["state"] = (new.state, old.state)
 
-    for key, value in new.attributes.items():
-        if (new_attr := old.attributes.get(key)) != value:
-            diff["attributes"].update({key: (value, new_attr)})
+    for key, value in new_attrs.items():
+        if (old_value := old_attrs.get(key)) != value:
+            attr_diff[key] = (value, old_value)
 
-    for key in old.attributes:
-        if key not in new.attributes:
-            diff["attributes"].update({key: (None, old.attributes.get(key))})
+    for key in old_attrs.keys() - new_attrs.keys():
+        attr_diff[key] = (None, old_attrs[key])
 
     return diff
 
@@ -178,6 +206,7 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
         hvac_mode: HVACMode | None = None,
         toggle_coolers: bool = False,
         toggle_heaters: bool = False,
+        hysteresis: float = DEFAULT_HYSTERESIS,
     ) -> None:
         """Initialize HVAC Group Climate."""
         self.hass = hass
@@ -192,9 +221,29 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
 
         self._hvac_mode = hvac_mode
         self._attr_hvac_modes = [HVACMode.OFF]
+        # Parallel membership cache for the list above, which stays the
+        # canonical form read by HA
+        self._hvac_modes_set: set[HVACMode] = {HVACMode.OFF}
 
         self._heaters: HvacGroupActuatorDict = HvacGroupActuatorDict()
         self._coolers: HvacGroupActuatorDict = HvacGroupActuatorDict()
+        # Routes an entity_id to its actuators with one hash lookup; a
+        # shared entity maps to both its heater and its cooler instance
+        self._actuator_index: dict[str, list[HvacGroupActuator]] = {}
+        # Last (min, max) attribute pair seen per actuator, as received;
+        # lets _update_temp_limits skip unchanged bounds without parsing
+        self._actuator_bounds_cache: dict[str, tuple[Any, Any]] = {}
+        # Entities present in both dicts, with memoized views per side;
+        # recomputed whenever membership changes
+        self._shared_entity_ids: frozenset[str] = frozenset()
+        self._common_heaters_cache: HvacGroupActuatorDict | None = None
+        self._common_coolers_cache: HvacGroupActuatorDict | None = None
+        self._pure_heaters_cache: HvacGroupActuatorDict | None = None
+        self._pure_coolers_cache: HvacGroupActuatorDict | None = None
+
+        # Mirrors TARGET_TEMPERATURE_RANGE in _attr_supported_features,
+        # kept current by the feature updaters below
+        self._supports_temp_range: bool = False
 
         if heaters is None:
             heaters = set()
@@ -212,11 +261,21 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
 
         self._current_temperature: float | None = None
 
-        self._min_temp = min_temp or TemperatureConverter.convert(
-            DEFAULT_MIN_TEMP, UnitOfTemperature.CELSIUS, self.temperature_unit
+        # async_setup_entry passes resolved limits, so these fallbacks
+        # only convert when the entity is constructed directly
+        self._min_temp = (
+            min_temp
+            if min_temp is not None
+            else TemperatureConverter.convert(
+                DEFAULT_MIN_TEMP, UnitOfTemperature.CELSIUS, self.temperature_unit
+            )
         )
-        self._max_temp = max_temp or TemperatureConverter.convert(
-            DEFAULT_MAX_TEMP, UnitOfTemperature.CELSIUS, self.temperature_unit
+        self._max_temp = (
+            max_temp
+            if max_temp is not None
+            else TemperatureConverter.convert(
+                DEFAULT_MAX_TEMP, UnitOfTemperature.CELSIUS, self.temperature_unit
+            )
         )
         self._target_temp_low = target_temp_low
         self._target_temp_high = target_temp_high
@@ -228,14 +287,31 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
         self._toggle_heaters_on_threshold = toggle_heaters if self._heaters else False
         self._toggle_coolers_on_threshold = toggle_coolers if self._coolers else False
 
-        self._hvac_running_lock = asyncio.Lock()
-        self._changing_actuators_lock = asyncio.Lock()
-        self._state_changed_lock = asyncio.Lock()
+        self._hysteresis = hysteresis
+
+        # Plain flag: only read/flipped between awaits on the event
+        # loop, so it needs no asyncio primitive
+        self._changing_actuators = False
         self._active = False
 
         self._require_actuator_mass_refresh: bool = False
         self._old_state: State | None = None
 
+        # Readiness barrier: decremented whenever an actuator flips to
+        # loaded, so the "everything loaded" gate is O(1) instead of a
+        # scan over both dicts per event
+        self._unloaded_actuators: int = len(self._heaters) + len(self._coolers)
+
+        # Coalesces bursts of commit requests (e.g. many actuators
+        # loading at startup) into at most one extra run
+        self._commit_in_progress: bool = False
+        self._commit_rerun: bool = False
+        self._pending_update_actuators: bool = False
+
+        # Snapshot of the fields last published through
+        # async_write_ha_state, used to suppress no-op writes
+        self._last_written_state: tuple | None = None
+
     @property
     def available(self) -> bool:
         """Return climate group availability."""
@@ -335,41 +411,75 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
     @property
     def heaters_that_are_also_coolers(self) -> HvacGroupActuatorDict:
         """Return a dict of heaters that are also coolers."""
-        return HvacGroupActuatorDict(
-            {
-                entity_id: actuator
-                for entity_id, actuator in self._heaters.items()
-                if entity_id in self._coolers
-            }
-        )
+        if (cached := self._common_heaters_cache) is None:
+            cached = self._common_heaters_cache = HvacGroupActuatorDict(
+                {
+                    entity_id: self._heaters[entity_id]
+                    for entity_id in self._shared_entity_ids
+                }
+            )
+        return cached
 
     @property
     def coolers_that_are_also_heaters(self) -> HvacGroupActuatorDict:
         """Return a dict of coolers that are also heaters."""
-        return HvacGroupActuatorDict(
-            {
-                entity_id: actuator
-                for entity_id, actuator in self._coolers.items()
-                if entity_id in self._heaters
-            }
-        )
+        if (cached := self._common_coolers_cache) is None:
+            cached = self._common_coolers_cache = HvacGroupActuatorDict(
+                {
+                    entity_id: self._coolers[entity_id]
+                    for entity_id in self._shared_entity_ids
+                }
+            )
+        return cached
+
+    def _pure_heaters_view(self) -> HvacGroupActuatorDict:
+        """Heaters that are not also coolers, memoized until membership changes."""
+        if (cached := self._pure_heaters_cache) is None:
+            cached = self._pure_heaters_cache = HvacGroupActuatorDict(
+                {
+                    entity_id: heater
+                    for entity_id, heater in self._heaters.items()
+                    if entity_id not in self._shared_entity_ids
+                }
+            )
+        return cached
+
+    def _pure_coolers_view(self) -> HvacGroupActuatorDict:
+        """Coolers that are not also heaters, memoized until membership changes."""
+        if (cached := self._pure_coolers_cache) is None:
+            cached = self._pure_coolers_cache = HvacGroupActuatorDict(
+                {
+                    entity_id: cooler
+                    for entity_id, cooler in self._coolers.items()
+                    if entity_id not in self._shared_entity_ids
+                }
+            )
+        return cached
+
+    def _invalidate_common_actuators(self) -> None:
+        """Recompute the shared entity ids and drop the memoized views."""
+        self._shared_entity_ids = frozenset(self._heaters.keys() & self._coolers.keys())
+        self._common_heaters_cache = None
+        self._common_coolers_cache = None
+        self._pure_heaters_cache = None
+        self._pure_coolers_cache = None
 
     async def async_added_to_hass(self) -> None:  # noqa: C901
         """Register listeners."""
 
-        for entity_id, heater in self._heaters.items():
-            if heater.state is None:
+        # One pass over the union of both sides: a shared entity has a
+        # single underlying state, so its limits and features are only
+        # evaluated once instead of once per role
+        for entity_id, actuators in self._actuator_index.items():
+            state = actuators[0].state
+            if state is None:
                 continue
-            self._update_temp_limits(entity_id, heater.state)
-            self._update_supported_features(heater.state)
-            heater.loaded = True
-
-        for entity_id, cooler in self._coolers.items():
-            if cooler.state is None:
-                continue
-            self._update_temp_limits(entity_id, cooler.state)
-            self._update_supported_features(cooler.state)
-            cooler.loaded = True
+            self._update_temp_limits(entity_id, state)
+            self._update_supported_features(state)
+            for actuator in actuators:
+                if not actuator.loaded:
+                    actuator.loaded = True
+                    self._unloaded_actuators -= 1
 
         # Check If we have an old state
         if (old_state := await self.async_get_last_state()) is not None:
@@ -401,111 +511,174 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
                 temp_sensor_state.entity_id, temp_sensor_state
             )
 
-        @callback
-        async def async_actuator_state_changed_listener(
+        async def _async_handle_actuator_change(
             event: EventType[EventStateChangedData],
+            entity_id: str,
+            actuators: list[HvacGroupActuator],
+            new_state: State,
+            old_state: State | None,
         ) -> None:
             """Handle actuator updates, like min/max temp changes."""
 
-            if event.data["new_state"] is None:
-                return
-
-            async with self._state_changed_lock:
-                # Take changes from actuators/sensors one by one
+            # The bookkeeping below is synchronous, so it runs atomically
+            # on the event loop and needs no lock; the only await is the
+            # old-state restore, which reads its snapshot up front and
+            # whose downstream commits coalesce
 
-                entity_id = event.data["entity_id"]
-                actuator_just_loaded = False
-                attempt_restore_old_state = False
+            actuator_just_loaded = False
+            attempt_restore_old_state = False
 
-                # Just  mark actuators as loaded if they weren't previously
-                # Handling happens below
+            # Just  mark actuators as loaded if they weren't previously
+            # Handling happens below
 
-                if entity_id in self._heaters:
-                    if not self._heaters[entity_id].loaded:
-                        self._heaters[entity_id].loaded = True
-                        actuator_just_loaded = True
-                        attempt_restore_old_state = (
-                            attempt_restore_old_state
-                            or self._update_hvac_modes(HvacActuatorType.HEATER)
-                        )
-
-                if entity_id in self._coolers:
-                    if not self._coolers[entity_id].loaded:
-                        self._coolers[entity_id].loaded = True
-                        actuator_just_loaded = True
-                        attempt_restore_old_state = (
-                            attempt_restore_old_state
-                            or self._update_hvac_modes(HvacActuatorType.COOLER)
-                        )
+            for actuator in actuators:
+                if not actuator.loaded:
+                    actuator.loaded = True
+                    self._unloaded_actuators -= 1
+                    actuator_just_loaded = True
+                    attempt_restore_old_state = (
+                        attempt_restore_old_state
+                        or self._update_hvac_modes(actuator.actuator_type)
+                    )
 
-                new_state = event.data["new_state"]
-                # Force checking of all attributes if the actuator was just loaded
-                old_state = (
-                    event.data["old_state"] if not actuator_just_loaded else None
-                )
-                state_changes = state_diff(new_state, old_state)
+            # Force checking of all attributes if the actuator was just loaded
+            if actuator_just_loaded:
+                old_state = None
 
+            # The full diff is only built for the debug log; the
+            # update decisions below compare the few attributes
+            # they care about directly
+            if LOGGER.isEnabledFor(logging.DEBUG):
                 LOGGER.debug(
                     "Actutator %s %s: %s (context %s)",
-                    event.data["entity_id"],
+                    entity_id,
                     "just loaded" if actuator_just_loaded else "changed state",
-                    state_changes,
+                    state_diff(new_state, old_state),
                     event.context.id,
                 )
 
-                if (
-                    state_changes.get("attributes", {}).get(ATTR_MIN_TEMP) is not None
-                    or state_changes.get("attributes", {}).get(ATTR_MAX_TEMP)
-                    is not None
-                ):
-                    self._update_temp_limits(entity_id, new_state, old_state)
+            # Skips internally when the limits are unchanged
+            self._update_temp_limits(entity_id, new_state)
 
-                if actuator_just_loaded:
-                    attempt_restore_old_state = (
-                        self._update_supported_features(new_state)
-                        or attempt_restore_old_state
-                    )
-                    if attempt_restore_old_state:
-                        await self.async_restore_old_state()
+            if old_state is None or old_state.attributes.get(
+                ATTR_SUPPORTED_FEATURES
+            ) != new_state.attributes.get(ATTR_SUPPORTED_FEATURES):
+                for actuator in actuators:
+                    actuator.reset_supported_features()
 
-                    if self._heaters.loaded and self._coolers.loaded:
-                        self._old_state = None
+            if actuator_just_loaded:
+                attempt_restore_old_state = (
+                    self._update_supported_features(new_state)
+                    or attempt_restore_old_state
+                )
+                if attempt_restore_old_state:
+                    await self.async_restore_old_state()
 
-                    # TODO sync new actuator to rest
-                else:
-                    # TODO send new temps to group
+                if self._unloaded_actuators == 0:
+                    self._old_state = None
 
-                    if event.context == self._context:
-                        # Ignore if triggered by an internal change
-                        return
-                    self.async_set_context(event.context)
+                # TODO sync new actuator to rest
+            else:
+                # TODO send new temps to group
+
+                if event.context == self._context:
+                    # Ignore if triggered by an internal change
+                    return
+                self.async_set_context(event.context)
 
         @callback
-        async def async_sensor_state_changed_listener(
+        def async_actuator_state_changed_listener(
             event: EventType[EventStateChangedData],
         ) -> None:
-            """Handle temperature sensor updates."""
+            """Filter actuator events, scheduling handling of real changes.
 
-            async with self._state_changed_lock:
-                # Take changes from actuators/sensors one by one
+            Registered as a plain callback so filtered events cost no
+            task creation; only events with actual work to do spawn the
+            coroutine that takes the state-changed lock.
+            """
 
-                # ...except if it was triggered by running the HVAC
-                if event.context == self._context and self.hass.is_running:
-                    # Ignore if triggered by an internal change
-                    return
-                self.async_set_context(event.context)
+            if (new_state := event.data["new_state"]) is None:
+                return
+
+            entity_id = event.data["entity_id"]
+            old_state = event.data["old_state"]
 
-                await self.async_update_temperature_sensor(
-                    event.data["entity_id"],
-                    event.data["new_state"],
-                    event.data["old_state"],
+            actuators = self._actuator_index.get(entity_id, ())
+
+            # Skip no-op events from chatty actuators before scheduling
+            # any work: if the actuator is already loaded and nothing we
+            # watch has changed, there is nothing to do
+            if (
+                old_state is not None
+                and new_state.state == old_state.state
+                and all(actuator.loaded for actuator in actuators)
+                and all(
+                    old_state.attributes.get(attr) == new_state.attributes.get(attr)
+                    for attr in _WATCHED_ACTUATOR_ATTRS
+                )
+            ):
+                return
+
+            self.hass.async_create_task(
+                _async_handle_actuator_change(
+                    event, entity_id, actuators, new_state, old_state
                 )
-                await self.async_commit_state_if_running()
+            )
 
+        async def _async_handle_sensor_change(
+            event: EventType[EventStateChangedData],
+        ) -> None:
+            """Handle temperature sensor updates."""
+
+            # No lock: updating the reading is synchronous and the
+            # control runs it triggers are coalesced downstream
+
+            self.async_set_context(event.context)
+
+            await self.async_update_temperature_sensor(
+                event.data["entity_id"],
+                event.data["new_state"],
+                event.data["old_state"],
+            )
+            await self.async_commit_state_if_running()
+
+        @callback
+        def async_sensor_state_changed_listener(
+            event: EventType[EventStateChangedData],
+        ) -> None:
+            """Filter sensor events, scheduling handling of external ones."""
+
+            # Ignore if triggered by an internal change
+            if event.context == self._context and self.hass.is_running:
+                return
+
+            new_state = event.data["new_state"]
+            old_state = event.data["old_state"]
+
+            # Refresh-only events with an unchanged reading (same state,
+            # unit and, for climate sources, current temperature) don't
+            # warrant a control run
+            if (
+                new_state is not None
+                and old_state is not None
+                and new_state.state == old_state.state
+                and new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                == old_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                and new_state.attributes.get(ATTR_CURRENT_TEMPERATURE)
+                == old_state.attributes.get(ATTR_CURRENT_TEMPERATURE)
+            ):
+                return
+
+            self.hass.async_create_task(_async_handle_sensor_change(event))
+
+        # A frozen copy of the tracked ids: membership is fixed after
+        # __init__, and the event helper gets a stable hashable set
+        # instead of a live dict view
+        self._tracked_entity_ids = frozenset(self._actuator_index)
         self.async_on_remove(
             async_track_state_change_event(
                 self.hass,
-                set().union(self._heaters.keys(), self._coolers.keys()),
+                self._tracked_entity_ids,
                 async_actuator_state_changed_listener,
             )
         )
@@ -529,17 +702,66 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
     async def async_commit_state_if_running(
         self, update_actuators: bool = False
     ) -> None:
-        """Compute and write the group state, if HA is running."""
+        """Compute and write the group state, if HA is running.
+
+        Concurrent requests coalesce: while a run is in flight, further
+        calls only flag a rerun and return, so a burst of N triggers
+        (e.g. every actuator loading at startup) costs at most one
+        extra run instead of N serialized ones.
+        """
         if not self.hass.is_running:
             return
 
-        await self.async_run_hvac(update_actuators=update_actuators)
+        self._pending_update_actuators |= update_actuators
+        if self._commit_in_progress:
+            self._commit_rerun = True
+            return
 
-        # Commit changes. Note that common actuators have different HvacGroupActuator
-        # instances, each with their own commit action
-        await self._heaters.async_commit()
-        await self._coolers.async_commit()
-        self.async_write_ha_state()
+        self._commit_in_progress = True
+        try:
+            while True:
+                self._commit_rerun = False
+                update = self._pending_update_actuators
+                self._pending_update_actuators = False
+
+                await self.async_run_hvac(update_actuators=update)
+
+                # Commit changes concurrently; a control run only queues a
+                # command on one side for a shared entity, so the heater and
+                # cooler commits never race on the same actuator. Note that
+                # common actuators have different HvacGroupActuator
+                # instances, each with their own commit action
+                await asyncio.gather(
+                    self._heaters.async_commit(), self._coolers.async_commit()
+                )
+
+                # Only publish when something user-visible changed since
+                # the last write; a no-op write would fan the state
+                # change event out to every listener for nothing
+                if (snapshot := self._state_snapshot()) != self._last_written_state:
+                    self._last_written_state = snapshot
+                    self.async_write_ha_state()
+
+                if not self._commit_rerun:
+                    break
+        finally:
+            self._commit_in_progress = False
+
+    def _state_snapshot(self) -> tuple:
+        """Collect the fields published through async_write_ha_state."""
+        return (
+            self._hvac_mode,
+            self._is_heating,
+            self._is_cooling,
+            self._current_temperature,
+            self._target_temp_low,
+            self._target_temp_high,
+            self._target_temperature,
+            self._min_temp,
+            self._max_temp,
+            self._attr_supported_features,
+            tuple(self._attr_hvac_modes),
+        )
 
     async def async_restore_old_state(self) -> None:
         """Restore old state if possible based on which group members have been loaded."""
@@ -548,10 +770,7 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
             return
 
         # If we have no initial temperature, restore
-        if (
-            ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-            & self._attr_supported_features
-        ):
+        if self._supports_temp_range:
             target_temp_low = (
                 self._target_temp_low
                 or old_state.attributes.get(ATTR_TARGET_TEMP_LOW)
@@ -582,10 +801,7 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
             await self.async_set_temperature(temperature=target_temp)
 
         desired_hvac_state = old_state.state
-        if (
-            desired_hvac_state is None
-            or desired_hvac_state not in self._attr_hvac_modes
-        ):
+        if desired_hvac_state is None or desired_hvac_state not in self._hvac_modes_set:
             desired_hvac_state = HVACMode.OFF
 
         self._hvac_mode = desired_hvac_state
@@ -604,6 +820,18 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
         if new_state.state in (None, STATE_UNAVAILABLE, STATE_UNKNOWN):
             return
 
+        if old_state is not None:
+            if new_state is old_state:
+                return
+            # For non-climate sources the reading is the state string
+            # itself, so an unchanged state needs no attribute lookups
+            if (
+                new_state.domain != CLIMATE_DOMAIN
+                and old_state.domain == new_state.domain
+                and new_state.state == old_state.state
+            ):
+                return
+
         # Current temperature can be retrieved from a `climate` or `sensor` entity
         new_temperature = (
             new_state.attributes.get(ATTR_CURRENT_TEMPERATURE)
@@ -621,6 +849,16 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
         if new_temperature == old_temperature:
             return
 
+        # Climate sources deliver the reading as a float already; only
+        # sensor state strings need coercion
+        if new_temperature is not None and not isinstance(new_temperature, float):
+            new_temperature = float(new_temperature)
+
+        # Dedupe numerically as well: "21.0" and "21.00" pass the raw
+        # comparison above but are the same reading
+        if new_temperature is not None and new_temperature == self._current_temperature:
+            return
+
         LOGGER.debug(
             "New temperature received from temp sensor %s: %s. Setting on HVAC Group %s",
             entity_id,
@@ -628,9 +866,7 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
             self.entity_id,
         )
 
-        self._current_temperature = (
-            float(new_temperature) if new_temperature is not None else new_temperature
-        )
+        self._current_temperature = new_temperature
 
         await self.async_commit_state_if_running()
 
@@ -639,29 +875,35 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
         """Update the actuators."""
 
         # If the update was requested because many actuators are being toggled, don't
-        if self._changing_actuators_lock.locked():
+        if self._changing_actuators:
             LOGGER.debug(
                 "Cannot run HVAC %s because the actuators are being mass controlled",
                 self.entity_id,
             )
             return
 
-        async with self._hvac_running_lock:
-            # Wait until we get a current temperature, target mode and target temp
-            # for the first actuation
-            if (
-                not self._active
-                and None
-                not in (
-                    self._current_temperature,
-                    self._hvac_mode,
-                )
-                and (
-                    None not in (self._target_temp_low, self._target_temp_high)
-                    or self._target_temperature is not None
-                )
-            ):
-                self._active = True
+        # No lock needed: the only caller is async_commit_state_if_running,
+        # whose in-flight flag already coalesces concurrent requests into
+        # a single run plus at most one rerun
+
+        # Wait until we get a current temperature, target mode and target temp
+        # for the first actuation
+        if (
+            not self._active
+            and None
+            not in (
+                self._current_temperature,
+                self._hvac_mode,
+            )
+            and (
+                None not in (self._target_temp_low, self._target_temp_high)
+                or self._target_temperature is not None
+            )
+        ):
+            self._active = True
+            # The ternary builds a throwaway string, so only do it when
+            # the record will actually be emitted
+            if LOGGER.isEnabledFor(logging.DEBUG):
                 LOGGER.debug(
                     (
                         "Obtained current and target temperatures (%s -> %s). "
@@ -670,27 +912,34 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
                     self._current_temperature,
                     (
                         f"{self._target_temp_low}-{self._target_temp_high}"
-                        if ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-                        & self._attr_supported_features
+                        if self._supports_temp_range
                         else f"{self._target_temperature}"
                     ),
                     self._hvac_mode,
                     self.entity_id,
                 )
 
-            if not self._active:
-                return
+        if not self._active:
+            return
 
-            await self.async_control_actuators(
-                update_actuators=update_actuators,
-                force_update_all=self._require_actuator_mass_refresh,
-            )
+        await self.async_control_actuators(
+            update_actuators=update_actuators,
+            force_update_all=self._require_actuator_mass_refresh,
+        )
 
     async def async_control_actuators(
         self, update_actuators: bool = False, force_update_all: bool = False
     ):
         """Control actuators based on needs."""
 
+        # The mode cannot change while this coroutine runs (commits are
+        # serialized), so resolve it once; hoist the repeatedly-read
+        # attributes to locals while we're at it
+        hvac_mode = self._hvac_mode
+        heaters = self._heaters
+        coolers = self._coolers
+        current_temperature = self._current_temperature
+
         try:
             if force_update_all:
                 self._require_actuator_mass_refresh = False
@@ -699,9 +948,9 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
                     self.entity_id,
                 )
 
-                await self._changing_actuators_lock.acquire()
+                self._changing_actuators = True
 
-                match self._hvac_mode:
+                match hvac_mode:
                     case HVACMode.HEAT:
                         await self._async_turn_off_coolers(pure=True)
                         await self._async_turn_on_heaters()
@@ -709,141 +958,181 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
                         await self._async_turn_off_heaters(pure=True)
                         await self._async_turn_on_coolers()
                     case HVACMode.HEAT_COOL:
-                        await self._async_turn_on_heaters(pure=True)
-                        await self._async_turn_on_coolers(pure=True)
+                        # Pure heaters and pure coolers are disjoint sets,
+                        # so their service calls can overlap
+                        await asyncio.gather(
+                            self._async_turn_on_heaters(pure=True),
+                            self._async_turn_on_coolers(pure=True),
+                        )
                     case HVACMode.OFF:
-                        await self._async_turn_off_coolers()
-                        await self._async_turn_off_heaters(
-                            pure=True
-                        )  # avoid turning off common elements twice
-
-            needs_cooling = False
-            needs_heating = False
+                        await asyncio.gather(
+                            self._async_turn_off_coolers(),
+                            self._async_turn_off_heaters(
+                                pure=True
+                            ),  # avoid turning off common elements twice
+                        )
 
             # Assertions are just for shutting up mypy
             assert (
                 self._target_temp_low and self._target_temp_high
             ) or self._target_temperature
-            assert self._current_temperature
+            assert current_temperature
+
+            # While a side is running, widen its band by the hysteresis
+            # so a reading hovering at the setpoint doesn't toggle the
+            # actuators on every sensor tick: heating keeps going until
+            # the temperature clears the low setpoint by the deadband,
+            # and symmetrically for cooling
+            too_cold = (self._target_temp_low or self._target_temperature) + (
+                self._hysteresis if self._is_heating else 0.0
+            ) >= current_temperature
+            too_hot = current_temperature >= (
+                (self._target_temp_high or self._target_temperature)
+                - (self._hysteresis if self._is_cooling else 0.0)
+            )
+            if too_cold and too_hot:
+                # Degenerate band (single target plus deadband): stick
+                # with the side that is currently running
+                if self._is_heating:
+                    too_hot = False
+                elif self._is_cooling:
+                    too_cold = False
+
+            needs_cooling = bool(too_hot and coolers)
+            needs_heating = bool(too_cold and heaters)
+
+            # Regime state machine: when the desired regime matches the
+            # recorded one and the actuator on/off flags already agree
+            # with it, every branch below is a no-op, so skip the walk
+            if (
+                not force_update_all
+                and not update_actuators
+                and needs_heating == self._is_heating
+                and needs_cooling == self._is_cooling
+                and self._are_heaters_active == needs_heating
+                and self._are_coolers_active == needs_cooling
+            ):
+                return
 
-            too_cold = (
-                self._target_temp_low or self._target_temperature
-            ) >= self._current_temperature
-            too_hot = self._current_temperature >= (
-                self._target_temp_high or self._target_temperature
+            await self._async_apply_side_toggle(
+                HvacActuatorType.COOLER, needs_cooling, update_actuators
             )
-            if too_hot and self._coolers:
-                needs_cooling = True
-                if (
-                    (not self._are_coolers_active or update_actuators)
-                    and self._toggle_coolers_on_threshold
-                    and self._hvac_mode in [HVACMode.COOL, HVACMode.HEAT_COOL]
-                ):
-                    LOGGER.debug(
-                        "Turning on cooling %s for HVAC group %s",
-                        ",".join(self._coolers.keys()),
-                        self.entity_id,
-                    )
-                    await self._async_turn_on_coolers()
-            elif (
-                self._are_coolers_active or update_actuators
-            ) and self._toggle_coolers_on_threshold:
-                LOGGER.debug(
-                    "Turning off cooling %s for HVAC group %s",
-                    ",".join(self._coolers.keys()),
-                    self.entity_id,
-                )
-                await self._async_turn_off_coolers(pure=True)
-
-            if too_cold and self._heaters:
-                needs_heating = True
-                if (
-                    (not self._are_heaters_active or update_actuators)
-                    and self._toggle_heaters_on_threshold
-                    and self._hvac_mode in [HVACMode.HEAT, HVACMode.HEAT_COOL]
-                ):
+            await self._async_apply_side_toggle(
+                HvacActuatorType.HEATER, needs_heating, update_actuators
+            )
+
+            # You can't need heating and cooling simultaneously
+            assert not needs_cooling or not needs_heating
+
+            await self._async_update_common_actuators(
+                needs_heating, needs_cooling, update_actuators, force_update_all
+            )
+
+            self._is_cooling = needs_cooling
+            self._is_heating = needs_heating
+        finally:
+            self._changing_actuators = False
+
+    async def _async_apply_side_toggle(
+        self, actuator_type: HvacActuatorType, needed: bool, update_actuators: bool
+    ) -> None:
+        """Turn one actuator side on or off to match whether it is needed."""
+
+        if actuator_type is HvacActuatorType.HEATER:
+            toggle = self._toggle_heaters_on_threshold
+            active = self._are_heaters_active
+            mode_allows = self._hvac_mode in _HEAT_MODES
+            actuators = self._heaters
+            side = "heating"
+        else:
+            toggle = self._toggle_coolers_on_threshold
+            active = self._are_coolers_active
+            mode_allows = self._hvac_mode in _COOL_MODES
+            actuators = self._coolers
+            side = "cooling"
+
+        if not toggle:
+            return
+
+        if needed:
+            if (not active or update_actuators) and mode_allows:
+                if LOGGER.isEnabledFor(logging.DEBUG):
                     LOGGER.debug(
-                        "Turning on heating %s for HVAC group %s",
-                        ",".join(self._heaters.keys()),
+                        "Turning on %s %s for HVAC group %s",
+                        side,
+                        ",".join(actuators.keys()),
                         self.entity_id,
                     )
-                    await self._async_turn_on_heaters()
-            elif (
-                self._are_heaters_active or update_actuators
-            ) and self._toggle_heaters_on_threshold:
+                await self._async_set_actuators(actuator_type, active=True, pure=False)
+        elif active or update_actuators:
+            if LOGGER.isEnabledFor(logging.DEBUG):
                 LOGGER.debug(
-                    "Turning off heating %s for HVAC group %s",
-                    ",".join(self._heaters.keys()),
+                    "Turning off %s %s for HVAC group %s",
+                    side,
+                    ",".join(actuators.keys()),
                     self.entity_id,
                 )
-                await self._async_turn_off_heaters(pure=True)
+            await self._async_set_actuators(actuator_type, active=False, pure=True)
 
-            # You can't need heating and cooling simultaneously
-            assert not needs_cooling or not needs_heating
+    async def _async_update_common_actuators(
+        self,
+        needs_heating: bool,
+        needs_cooling: bool,
+        update_actuators: bool,
+        force_update_all: bool,
+    ) -> None:
+        """Point the common actuators at the side that needs them."""
 
-            if needs_heating:
-                if not self._is_heating and self._hvac_mode in [
-                    HVACMode.HEAT,
-                    HVACMode.HEAT_COOL,
-                ]:
-                    LOGGER.debug(
-                        "Setting common actuators  %s as heaters for HVAC group %s",
-                        ",".join(self.common_actuators.keys()),
-                        self.entity_id,
-                    )
-                    await self._async_set_common_actuators_as_heaters()
-                elif force_update_all and self._hvac_mode == HVACMode.HEAT_COOL:
+        if not self._shared_entity_ids:
+            return
+
+        debug_enabled = LOGGER.isEnabledFor(logging.DEBUG)
+        # In heat/cool mode a forced refresh must re-assert the common
+        # actuators even when the recorded regime already matches
+        forced_heat_cool = force_update_all and self._hvac_mode == HVACMode.HEAT_COOL
+
+        if needs_heating:
+            if (
+                not self._is_heating and self._hvac_mode in _HEAT_MODES
+            ) or forced_heat_cool:
+                if debug_enabled:
                     LOGGER.debug(
                         "Setting common actuators  %s as heaters for HVAC group %s",
                         ",".join(self.common_actuators.keys()),
                         self.entity_id,
                     )
-                    await self._async_set_common_actuators_as_heaters()
-            elif needs_cooling:
-                if not self._is_cooling and self._hvac_mode in [
-                    HVACMode.COOL,
-                    HVACMode.HEAT_COOL,
-                ]:
-                    LOGGER.debug(
-                        "Setting common actuators  %s as coolers for HVAC group %s",
-                        ",".join(self.common_actuators.keys()),
-                        self.entity_id,
-                    )
-                    await self._async_set_common_actuators_as_coolers()
-                elif force_update_all and self._hvac_mode == HVACMode.HEAT_COOL:
+                await self._async_set_common_actuators_as_heaters()
+        elif needs_cooling:
+            if (
+                not self._is_cooling and self._hvac_mode in _COOL_MODES
+            ) or forced_heat_cool:
+                if debug_enabled:
                     LOGGER.debug(
                         "Setting common actuators  %s as coolers for HVAC group %s",
                         ",".join(self.common_actuators.keys()),
                         self.entity_id,
                     )
-                    await self._async_set_common_actuators_as_coolers()
-            else:
-                if (
-                    (self._is_heating or update_actuators)
-                    and self._toggle_heaters_on_threshold
-                ) or (
-                    (self._is_cooling or update_actuators)
-                    and self._toggle_coolers_on_threshold
-                ):
-                    LOGGER.debug(
-                        "Turning off common actuators  %s for HVAC group %s",
-                        ",".join(self.common_actuators.keys()),
-                        self.entity_id,
-                    )
-                    await self._async_turn_off_common_actuators()
-                elif force_update_all and self._hvac_mode == HVACMode.HEAT_COOL:
-                    LOGGER.debug(
-                        "Setting common actuators  %s as heaters for HVAC group %s",
-                        ",".join(self.common_actuators.keys()),
-                        self.entity_id,
-                    )
-                    await self._async_set_common_actuators_as_heaters()
-
-            self._is_cooling = needs_cooling
-            self._is_heating = needs_heating
-        finally:
-            if self._changing_actuators_lock.locked():
-                self._changing_actuators_lock.release()
+                await self._async_set_common_actuators_as_coolers()
+        elif (
+            (self._is_heating or update_actuators) and self._toggle_heaters_on_threshold
+        ) or (
+            (self._is_cooling or update_actuators) and self._toggle_coolers_on_threshold
+        ):
+            if debug_enabled:
+                LOGGER.debug(
+                    "Turning off common actuators  %s for HVAC group %s",
+                    ",".join(self.common_actuators.keys()),
+                    self.entity_id,
+                )
+            await self._async_turn_off_common_actuators()
+        elif forced_heat_cool:
+            if debug_enabled:
+                LOGGER.debug(
+                    "Setting common actuators  %s as heaters for HVAC group %s",
+                    ",".join(self.common_actuators.keys()),
+                    self.entity_id,
+                )
+            await self._async_set_common_actuators_as_heaters()
 
     def _update_hvac_modes(self, actuator_type: HvacActuatorType) -> bool:
         """Update the HVAC modes available for the group when a new actuator is loaded.
@@ -854,30 +1143,33 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
         modes_have_changed: bool = False
 
         required_mode = (
-            HVACMode.HEAT if actuator_type == HvacActuatorType.HEATER else HVACMode.COOL
+            HVACMode.HEAT if actuator_type is HvacActuatorType.HEATER else HVACMode.COOL
         )
         opposite_mode = (
-            HVACMode.COOL if actuator_type == HvacActuatorType.HEATER else HVACMode.HEAT
+            HVACMode.COOL if actuator_type is HvacActuatorType.HEATER else HVACMode.HEAT
         )
 
         LOGGER.debug("Making sure %s supports %sing", self.entity_id, required_mode)
 
         if not (
-            required_mode in self._attr_hvac_modes
-            or HVACMode.HEAT_COOL in self._attr_hvac_modes
+            required_mode in self._hvac_modes_set
+            or HVACMode.HEAT_COOL in self._hvac_modes_set
         ):
             self._attr_hvac_modes.append(required_mode)
+            self._hvac_modes_set.add(required_mode)
             modes_have_changed = True
-            if opposite_mode in self._attr_hvac_modes:
+            if opposite_mode in self._hvac_modes_set:
                 self._attr_hvac_modes.append(HVACMode.HEAT_COOL)
-                self._attr_supported_features = (
-                    ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-                )
-            else:
-                self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
+                self._hvac_modes_set.add(HVACMode.HEAT_COOL)
+            self._supports_temp_range = HVACMode.HEAT_COOL in self._hvac_modes_set
+            self._attr_supported_features = (
+                ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
+                if self._supports_temp_range
+                else ClimateEntityFeature.TARGET_TEMPERATURE
+            )
 
-        if modes_have_changed:
-            modes = [mode for mode in HVACMode if mode in self._attr_hvac_modes]
+        if modes_have_changed and LOGGER.isEnabledFor(logging.DEBUG):
+            modes = [mode for mode in HVACMode if mode in self._hvac_modes_set]
             LOGGER.debug(
                 "New HVAC modes supported by %s: %s",
                 self.entity_id,
@@ -905,12 +1197,14 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
             self._attr_supported_features = (
                 ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
             )
+            self._supports_temp_range = True
             self._target_temperature = None
         else:
             feature_has_changed = not bool(
                 ClimateEntityFeature.TARGET_TEMPERATURE & self._attr_supported_features
             )
             self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE
+            self._supports_temp_range = False
             self._target_temp_low = self._target_temp_high = None
 
         return feature_has_changed
@@ -920,51 +1214,59 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
         self,
         entity_id: str,
         new_state: State | None,
-        old_state: State | None = None,
     ) -> None:
         """Update mix/max temps when a new actuator loads."""
         if new_state is None:
             return
 
-        if (
-            old_state is None
-            or old_state.attributes.get(ATTR_MIN_TEMP)
-            != new_state.attributes.get(ATTR_MIN_TEMP)
-            or old_state.attributes.get(ATTR_MAX_TEMP)
-            != new_state.attributes.get(ATTR_MAX_TEMP)
-        ):
-            self._min_temp = min(
-                float(new_state.attributes.get(ATTR_MAX_TEMP, self._min_temp)),
-                max(
-                    self._min_temp,
-                    float(new_state.attributes.get(ATTR_MIN_TEMP, self._min_temp)),
-                ),
-            )
-            if self._target_temp_low is not None:
-                self._target_temp_low = max(self._target_temp_low, self._min_temp)
-
-            self._max_temp = max(
-                float(new_state.attributes.get(ATTR_MIN_TEMP, self._max_temp)),
-                min(
-                    self._max_temp,
-                    float(new_state.attributes.get(ATTR_MAX_TEMP, self._max_temp)),
-                ),
-            )
-            if self._target_temp_high is not None:
-                self._target_temp_high = min(self._target_temp_high, self._max_temp)
+        new_attrs = new_state.attributes
+        new_min = new_attrs.get(ATTR_MIN_TEMP)
+        new_max = new_attrs.get(ATTR_MAX_TEMP)
 
-            LOGGER.debug(
-                (
-                    "New min/max temps received from actuator %s: (%s, %s). "
-                    "HVAC Group %s new min/max temps: %s, %s"
-                ),
-                entity_id,
-                new_state.attributes.get(ATTR_MIN_TEMP, self._max_temp),
-                new_state.attributes.get(ATTR_MAX_TEMP, self._min_temp),
-                self.entity_id,
+        # An actuator advertising no bounds can't move the group limits
+        if new_min is None and new_max is None:
+            return
+
+        if self._actuator_bounds_cache.get(entity_id) == (new_min, new_max):
+            return
+        self._actuator_bounds_cache[entity_id] = (new_min, new_max)
+
+        # Parse the (possibly string) attributes once
+        new_min_f = float(new_min) if new_min is not None else None
+        new_max_f = float(new_max) if new_max is not None else None
+
+        self._min_temp = min(
+            new_max_f if new_max_f is not None else self._min_temp,
+            max(
                 self._min_temp,
+                new_min_f if new_min_f is not None else self._min_temp,
+            ),
+        )
+        if self._target_temp_low is not None:
+            self._target_temp_low = max(self._target_temp_low, self._min_temp)
+
+        self._max_temp = max(
+            new_min_f if new_min_f is not None else self._max_temp,
+            min(
                 self._max_temp,
-            )
+                new_max_f if new_max_f is not None else self._max_temp,
+            ),
+        )
+        if self._target_temp_high is not None:
+            self._target_temp_high = min(self._target_temp_high, self._max_temp)
+
+        LOGGER.debug(
+            (
+                "New min/max temps received from actuator %s: (%s, %s). "
+                "HVAC Group %s new min/max temps: %s, %s"
+            ),
+            entity_id,
+            new_min,
+            new_max,
+            self.entity_id,
+            self._min_temp,
+            self._max_temp,
+        )
 
     def _add_heater(self, heater_entity_id: str) -> None:
         """Add a heater actuator referenced by entity_id."""
@@ -972,7 +1274,9 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
             return
 
         heater = HvacGroupHeater(self.hass, heater_entity_id)
-        self._heaters.update({heater_entity_id: heater})
+        self._heaters[heater_entity_id] = heater
+        self._actuator_index.setdefault(heater_entity_id, []).append(heater)
+        self._invalidate_common_actuators()
 
         if heater.state:
             self._update_hvac_modes(HvacActuatorType.HEATER)
@@ -984,7 +1288,9 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
             return
 
         cooler = HvacGroupCooler(self.hass, cooler_entity_id)
-        self._coolers.update({cooler_entity_id: cooler})
+        self._coolers[cooler_entity_id] = cooler
+        self._actuator_index.setdefault(cooler_entity_id, []).append(cooler)
+        self._invalidate_common_actuators()
 
         if cooler.state:
             self._update_hvac_modes(HvacActuatorType.COOLER)
@@ -992,10 +1298,15 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set hvac mode callback."""
-        if hvac_mode not in self._attr_hvac_modes:
+        if hvac_mode not in self._hvac_modes_set:
             LOGGER.warning("Unsupported hvac mode: %s", hvac_mode)
             return
 
+        # Re-asserting the current mode (UI refreshes, polling
+        # integrations) doesn't warrant a full actuator fan-out
+        if hvac_mode == self._hvac_mode:
+            return
+
         LOGGER.debug("Setting mode %s on HVAC group %s", hvac_mode, self.entity_id)
 
         self._hvac_mode = hvac_mode
@@ -1009,133 +1320,92 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
         temp = kwargs.get(ATTR_TEMPERATURE)
         hvac_mode = kwargs.get(ATTR_HVAC_MODE)
 
-        if temp_low is not None:
+        changed = False
+
+        if temp_low is not None and temp_low != self._target_temp_low:
             self._target_temp_low = temp_low
+            changed = True
 
-        if temp_high is not None:
+        if temp_high is not None and temp_high != self._target_temp_high:
             self._target_temp_high = temp_high
+            changed = True
 
-        if temp is not None:
+        if temp is not None and temp != self._target_temperature:
             self._target_temperature = temp
+            changed = True
 
         if hvac_mode is not None:
-            if hvac_mode not in self._attr_hvac_modes:
+            if hvac_mode not in self._hvac_modes_set:
                 LOGGER.warning("Unsupported hvac mode: %s", hvac_mode)
                 return
-            self._hvac_mode = hvac_mode
+            if hvac_mode != self._hvac_mode:
+                self._hvac_mode = hvac_mode
+                changed = True
 
-        LOGGER.debug(
-            "Setting temperature (%s) on HVAC group %s",
-            (
-                f"{temp_low}-{temp_high}"
-                if ClimateEntityFeature.TARGET_TEMPERATURE_RANGE
-                & self._attr_supported_features
-                else f"{temp}"
-            ),
-            self.entity_id,
-        )
+        # Nothing actually moved, so skip the mass refresh a no-op
+        # update would otherwise trigger
+        if not changed:
+            return
+
+        if LOGGER.isEnabledFor(logging.DEBUG):
+            LOGGER.debug(
+                "Setting temperature (%s) on HVAC group %s",
+                (f"{temp_low}-{temp_high}" if self._supports_temp_range else f"{temp}"),
+                self.entity_id,
+            )
 
         self._require_actuator_mass_refresh = True
         await self.async_commit_state_if_running(update_actuators=True)
 
-    async def _async_turn_on_coolers(self, pure: bool = False) -> None:
-        """Turn on coolers. If `pure` is `True`, it only affects coolers which are not also heaters."""
-        if not self._coolers:
+    async def _async_set_actuators(
+        self, actuator_type: HvacActuatorType, active: bool, pure: bool
+    ) -> None:
+        """Turn one actuator side on or off.
+
+        If `pure` is `True`, only affect actuators which don't also serve
+        the opposite side.
+        """
+        is_heater = actuator_type is HvacActuatorType.HEATER
+        actuators = self._heaters if is_heater else self._coolers
+        if not actuators:
             return
 
-        self._are_coolers_active = True
-        targets: HvacGroupActuatorDict = (
-            HvacGroupActuatorDict(
-                {
-                    entity_id: cooler
-                    for entity_id, cooler in self._coolers.items()
-                    if entity_id not in self._heaters
-                }
-            )
-            if pure
-            else self._coolers
-        )
-        await targets.async_turn_on(
+        if is_heater:
+            self._are_heaters_active = active
+            targets = self._pure_heaters_view() if pure else actuators
+        else:
+            self._are_coolers_active = active
+            targets = self._pure_coolers_view() if pure else actuators
+
+        method = targets.async_turn_on if active else targets.async_turn_off
+        await method(
             temperature=self.target_temperature,
             target_temp_high=self.target_temperature_high,
             target_temp_low=self.target_temperature_low,
             context=self._context,
         )
 
+    async def _async_turn_on_coolers(self, pure: bool = False) -> None:
+        """Turn on coolers. If `pure` is `True`, it only affects coolers which are not also heaters."""
+        await self._async_set_actuators(HvacActuatorType.COOLER, True, pure)
+
     async def _async_turn_off_coolers(self, pure: bool = False) -> None:
         """Turn off coolers. If `pure` is `True`, it only affects coolers which are not also heaters."""
-        if not self._coolers:
-            return
-
-        self._are_coolers_active = False
-        targets: HvacGroupActuatorDict = (
-            HvacGroupActuatorDict(
-                {
-                    entity_id: cooler
-                    for entity_id, cooler in self._coolers.items()
-                    if entity_id not in self._heaters
-                }
-            )
-            if pure
-            else self._coolers
-        )
-        await targets.async_turn_off(
-            temperature=self.target_temperature,
-            target_temp_high=self.target_temperature_high,
-            target_temp_low=self.target_temperature_low,
-            context=self._context,
-        )
+        await self._async_set_actuators(HvacActuatorType.COOLER, False, pure)
 
     async def _async_turn_on_heaters(self, pure: bool = False) -> None:
         """Turn on heaters. If `pure` is `True`, it only affects heaters which are not also coolers."""
-        if not self._heaters:
-            return
-
-        self._are_heaters_active = True
-        targets: HvacGroupActuatorDict = (
-            HvacGroupActuatorDict(
-                {
-                    entity_id: heater
-                    for entity_id, heater in self._heaters.items()
-                    if entity_id not in self._coolers
-                }
-            )
-            if pure
-            else self._heaters
-        )
-        await targets.async_turn_on(
-            temperature=self.target_temperature,
-            target_temp_high=self.target_temperature_high,
-            target_temp_low=self.target_temperature_low,
-            context=self._context,
-        )
+        await self._async_set_actuators(HvacActuatorType.HEATER, True, pure)
 
     async def _async_turn_off_heaters(self, pure: bool = False) -> None:
         """Turn off heaters. If `pure` is `True`, it only affects heaters which are not also coolers."""
-        if not self._heaters:
-            return
-
-        self._are_heaters_active = False
-        targets: HvacGroupActuatorDict = (
-            HvacGroupActuatorDict(
-                {
-                    entity_id: heater
-                    for entity_id, heater in self._heaters.items()
-                    if entity_id not in self._coolers
-                }
-            )
-            if pure
-            else self._heaters
-        )
-        await targets.async_turn_off(
-            temperature=self.target_temperature,
-            target_temp_high=self.target_temperature_high,
-            target_temp_low=self.target_temperature_low,
-            context=self._context,
-        )
+        await self._async_set_actuators(HvacActuatorType.HEATER, False, pure)
 
     async def _async_set_common_actuators_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Turn on common actuators to a certain HVAC mode."""
+        if not self._shared_entity_ids:
+            return
+
         await self.common_actuators.async_set_temperature(
             temperature=self.target_temperature,
             target_temp_high=self.target_temperature_high,
@@ -1146,6 +1416,9 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
 
     async def _async_set_common_actuators_temperature(self) -> None:
         """Set temperature on common actuators."""
+        if not self._shared_entity_ids:
+            return
+
         await self.common_actuators.async_set_temperature(
             temperature=self.target_temperature,
             target_temp_high=self.target_temperature_high,
@@ -1155,6 +1428,9 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
 
     async def _async_set_common_actuators_as_heaters(self) -> None:
         """Set common actuators to work as heaters."""
+        if not self._shared_entity_ids:
+            return
+
         await self.heaters_that_are_also_coolers.async_set_temperature(
             temperature=self.target_temperature,
             target_temp_high=self.target_temperature_high,
@@ -1165,6 +1441,9 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
 
     async def _async_set_common_actuators_as_coolers(self) -> None:
         """Set common actuators to work as coolers."""
+        if not self._shared_entity_ids:
+            return
+
         await self.coolers_that_are_also_heaters.async_set_temperature(
             temperature=self.target_temperature,
             target_temp_high=self.target_temperature_high,
@@ -1175,6 +1454,9 @@ class HvacGroupClimateEntity(ClimateEntity, RestoreEntity):
 
     async def _async_turn_off_common_actuators(self) -> None:
         """Turn off common actuators."""
+        if not self._shared_entity_ids:
+            return
+
         await self.common_actuators.async_set_temperature(
             temperature=self.target_temperature,
             target_temp_high=self.target_temperature_high,
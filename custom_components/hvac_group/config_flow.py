@@ -24,8 +24,10 @@ from .const import (
     CONF_COOLERS,
     CONF_HEATERS,
     CONF_HIDE_MEMBERS,
+    CONF_HYSTERESIS,
     CONF_TOGGLE_COOLERS,
     CONF_TOGGLE_HEATERS,
+    DEFAULT_HYSTERESIS,
     DOMAIN,
 )
 
@@ -48,6 +50,11 @@ OPTIONS_SCHEMA = {
             ]
         )
     ),
+    vol.Optional(CONF_HYSTERESIS, default=DEFAULT_HYSTERESIS): selector.NumberSelector(
+        selector.NumberSelectorConfig(
+            min=0, max=5, step=0.1, mode=selector.NumberSelectorMode.BOX
+        )
+    ),
     vol.Required(CONF_HIDE_MEMBERS, default=False): selector.BooleanSelector(),
 }
 
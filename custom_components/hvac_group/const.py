@@ -5,6 +5,7 @@ DOMAIN = "hvac_group"
 LOGGER: Logger = getLogger(__package__)
 
 CONF_HVAC_MODES = "hvac_modes"
+CONF_HYSTERESIS = "hysteresis"
 CONF_CURRENT_TEMPERATURE_ENTITY_ID = "temperature_entity_id"
 CONF_COOLERS = "coolers"
 CONF_HEATERS = "heaters"
@@ -18,4 +19,8 @@ CONF_TOGGLE_COOLERS = "toggle_coolers"
 CONF_TOGGLE_HEATERS = "toggle_heaters"
 CONF_HIDE_MEMBERS = "hide_members"
 
+# Deadband applied while an actuator side is running, so a reading
+# hovering around the setpoint doesn't toggle the group on every tick
+DEFAULT_HYSTERESIS = 0.3
+
 VERSION = "0.1.1"
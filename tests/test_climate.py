@@ -250,7 +250,9 @@ async def test_setup(
 
     with patch(
         "custom_components.hvac_group.actuator.HvacGroupActuator._async_call_climate_service"
-    ) as mock_call_climate_service:
+    ) as mock_call_climate_service, patch(
+        "custom_components.hvac_group.actuator.async_call_grouped_climate_service"
+    ) as mock_grouped_climate_service:
         await hass.services.async_call(
             CLIMATE_DOMAIN,
             SERVICE_SET_TEMPERATURE,
@@ -263,7 +265,12 @@ async def test_setup(
             blocking=True,
         )
 
-        assert mock_call_climate_service.call_count == 5
+        # Every actuator gets exactly one command, either individually
+        # or as part of a batched multi-target call
+        grouped_entity_count = sum(
+            len(call.args[1]) for call in mock_grouped_climate_service.call_args_list
+        )
+        assert mock_call_climate_service.call_count + grouped_entity_count == 5
 
 
 @pytest.mark.parametrize(
@@ -447,7 +454,9 @@ async def test_call_forwarding(
 
     with patch(
         "custom_components.hvac_group.actuator.HvacGroupActuator._async_call_climate_service"
-    ) as mock_call_climate_service:
+    ) as mock_call_climate_service, patch(
+        "custom_components.hvac_group.actuator.async_call_grouped_climate_service"
+    ) as mock_grouped_climate_service:
         # command_args is a dict with keys representing actuators or the temp sensor
         service_call_data = {}
         if command.get(ATTR_TARGET_TEMP_LOW):
@@ -474,7 +483,7 @@ async def test_call_forwarding(
             )
         await hass.async_block_till_done()
 
-        assert mock_call_climate_service.called
+        assert mock_call_climate_service.called or mock_grouped_climate_service.called
 
         # Check if calls to climate.set_temperature include the expected args
         for call in mock_call_climate_service.call_args_list:
@@ -483,3 +492,60 @@ async def test_call_forwarding(
                 f"{call.args[0]} expected a call with {expected_args}, "
                 f"actual value was {call.args[2]}"
             )
+
+        # Batched multi-target calls carry the same data for all targets
+        for call in mock_grouped_climate_service.call_args_list:
+            for entity_id in call.args[1]:
+                expected_args = output.get(entity_id, {})
+                assert expected_args.items() <= call.args[3].items(), (
+                    f"{entity_id} expected a call with {expected_args}, "
+                    f"actual value was {call.args[3]}"
+                )
+
+
+@pytest.mark.parametrize(
+    ("setup_extras", "group_extras"),
+    [
+        (
+            {DEMO_TEMP_SENSOR: (20, {})},
+            {
+                "options": {CONF_TOGGLE_COOLERS: True, CONF_TOGGLE_HEATERS: True},
+                ATTR_TARGET_TEMP_LOW: 21,
+                ATTR_TARGET_TEMP_HIGH: 23,
+                ATTR_HVAC_MODE: HVACMode.HEAT,
+            },
+        )
+    ],
+)
+@pytest.mark.asyncio
+async def test_hysteresis_deadband(
+    hass: HomeAssistant,
+    setup_extras,
+    group_extras,
+    hvac_group_entry: ConfigEntry,
+) -> None:
+    """Test that readings inside the deadband don't toggle running actuators."""
+
+    with patch(
+        "custom_components.hvac_group.actuator.HvacGroupActuator._async_call_climate_service"
+    ) as mock_call_climate_service, patch(
+        "custom_components.hvac_group.actuator.async_call_grouped_climate_service"
+    ) as mock_grouped_climate_service:
+        # The group is heating towards 21. A reading which crosses the
+        # setpoint but stays inside the default 0.3 degree deadband must
+        # keep the heaters running without dispatching any service call
+        hass.states.async_set(
+            DEMO_TEMP_SENSOR, 21.1, {ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE}
+        )
+        await hass.async_block_till_done()
+
+        assert not mock_call_climate_service.called
+        assert not mock_grouped_climate_service.called
+
+        # Once the reading clears the deadband, the heaters turn off
+        hass.states.async_set(
+            DEMO_TEMP_SENSOR, 21.5, {ATTR_DEVICE_CLASS: SensorDeviceClass.TEMPERATURE}
+        )
+        await hass.async_block_till_done()
+
+        assert mock_call_climate_service.called or mock_grouped_climate_service.called